@@ -0,0 +1,39 @@
+"""Numba-compiled kernels for batch frame processing.
+
+Importing this module requires the optional ``numba`` dependency.
+"""
+
+from __future__ import annotations
+
+import numba
+import numpy as np
+import numpy.typing as npt
+
+
+@numba.njit(cache=True, boundscheck=False)
+def checksum_batch(frames: npt.NDArray[np.uint8]) -> npt.NDArray[np.uint8]:
+    """Calculate checksums for an ``(N, 8)`` or ``(N, 9)`` uint8 frame array."""
+    out = np.empty(frames.shape[0], np.uint8)
+    for i in range(frames.shape[0]):
+        total = 0
+        for j in range(1, 8):
+            total += frames[i, j]
+        out[i] = (-total) & 0xFF
+    return out
+
+
+@numba.njit(cache=True, boundscheck=False)
+def parse_many(
+    frames: npt.NDArray[np.uint8],
+) -> tuple[npt.NDArray[np.uint16], npt.NDArray[np.bool_]]:
+    """Validate header/checksum and decode ppm for an ``(N, 9)`` frame array."""
+    ppm = np.zeros(frames.shape[0], np.uint16)
+    valid = np.zeros(frames.shape[0], np.bool_)
+    for i in range(frames.shape[0]):
+        total = 0
+        for j in range(1, 8):
+            total += frames[i, j]
+        if frames[i, 0] == 0xFF and ((-total) & 0xFF) == frames[i, 8]:
+            valid[i] = True
+            ppm[i] = (np.uint16(frames[i, 2]) << 8) | frames[i, 3]
+    return ppm, valid
@@ -0,0 +1,66 @@
+"""Batch decoding of recorded MH-Z14A response logs.
+
+Requires the optional ``numpy`` dependency (``pip install mhz14a[numpy]``).
+"""
+
+import os
+from typing import TYPE_CHECKING, Tuple, Union
+
+from .exceptions import MHZ14AError
+from .sensor import FRAME_SIZE, _as_frame_array, _parse_many
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+
+def load_log(path: "Union[str, os.PathLike[str]]") -> "npt.NDArray[np.uint8]":
+    """Load a raw log of concatenated 9-byte response frames.
+
+    Args:
+        path: Path to a binary file of back-to-back response frames
+
+    Returns:
+        Writable ``(N, 9)`` uint8 array with one frame per row
+
+    Raises:
+        MHZ14AError: If the file size is not a multiple of the frame size
+
+    Example:
+        >>> frames = load_log('co2.bin')
+        >>> frames.shape
+        (1440, 9)
+    """
+    # A bytearray keeps the returned array writable for in-place cleanup
+    with open(path, "rb") as f:
+        data = bytearray(f.read())
+
+    if len(data) % FRAME_SIZE:
+        raise MHZ14AError(
+            f"Invalid log size: {len(data)} bytes is not a multiple of {FRAME_SIZE}"
+        )
+
+    return _as_frame_array(data)
+
+
+def decode(
+    frames: "npt.NDArray[np.uint8]",
+) -> "Tuple[npt.NDArray[np.uint16], npt.NDArray[np.bool_]]":
+    """Validate and decode CO₂ readings from an array of response frames.
+
+    Args:
+        frames: ``(N, 9)`` uint8 array, as returned by :func:`load_log`
+
+    Returns:
+        Tuple of ``(N,)`` uint16 ppm values and ``(N,)`` bool flags marking
+        frames with a valid header and checksum; invalid frames report 0 ppm
+
+    Raises:
+        ValueError: If ``frames`` is not a 2-D uint8 array with 9-byte rows
+
+    Example:
+        >>> ppm, valid = decode(load_log('co2.bin'))
+        >>> ppm[valid].mean()
+        612.4
+    """
+    return _parse_many(frames)
@@ -0,0 +1,55 @@
+"""Lightweight test doubles for serial ports."""
+
+from typing import Optional
+
+
+class FakeSerial:
+    """Minimal stand-in for ``serial.Serial`` returning canned responses.
+
+    Args:
+        response: Bytes returned by ``read()`` after each write
+    """
+
+    __slots__ = (
+        "is_open",
+        "response",
+        "write_result",
+        "read_error",
+        "read_pos",
+        "last_write",
+        "write_count",
+        "read_count",
+    )
+
+    def __init__(self, response: bytes = b"") -> None:
+        self.is_open = True
+        self.response = response
+        self.write_result: Optional[int] = None
+        self.read_error: Optional[Exception] = None
+        self.read_pos = 0
+        self.last_write: Optional[bytes] = None
+        self.write_count = 0
+        self.read_count = 0
+
+    def write(self, data: bytes) -> int:
+        """Record written data and report the number of bytes sent."""
+        self.last_write = data
+        self.write_count += 1
+        self.read_pos = 0
+        return len(data) if self.write_result is None else self.write_result
+
+    def read(self, size: int = 1) -> bytes:
+        """Return the next chunk of the canned response."""
+        self.read_count += 1
+        if self.read_error is not None:
+            raise self.read_error
+        chunk = self.response[self.read_pos:self.read_pos + size]
+        self.read_pos += len(chunk)
+        return chunk
+
+    def flush(self) -> None:
+        """Do nothing; there is no output buffer."""
+
+    def close(self) -> None:
+        """Mark the port as closed."""
+        self.is_open = False
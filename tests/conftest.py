@@ -0,0 +1,32 @@
+"""Shared fixtures for mhz14a tests."""
+
+from typing import Iterator, Tuple
+
+import pytest
+
+from _fakes import FakeSerial
+from mhz14a import sensor as sensor_module
+from mhz14a.sensor import MHZ14A
+
+
+@pytest.fixture
+def sensor(monkeypatch: pytest.MonkeyPatch) -> Iterator[Tuple[MHZ14A, FakeSerial]]:
+    """Yield a connected sensor backed by a fake serial port."""
+    fake_serial = FakeSerial()
+    monkeypatch.setattr("serial.Serial", lambda *args, **kwargs: fake_serial)
+
+    sensor_obj = MHZ14A('/dev/test')
+    sensor_obj._connect()
+    yield sensor_obj, fake_serial
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def batch_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a batch test against the Numba kernel and the pure NumPy fallback."""
+    pytest.importorskip("numpy")
+    backend: str = request.param
+    if backend == "numba":
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(sensor_module, "_load_numba_kernels", lambda: None)
+    return backend
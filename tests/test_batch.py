@@ -0,0 +1,79 @@
+"""Test NumPy/Numba batch checksum and decoding helpers."""
+
+import re
+from typing import Pattern, Tuple
+
+import pytest
+
+from mhz14a.sensor import _checksum, _checksum_batch, _parse_many
+
+np = pytest.importorskip("numpy")
+
+FRAME_415_PPM = b"\xff\x86\x01\x9f\x00\x00\x00\x00\xda"
+FRAME_2000_PPM = b"\xff\x86\x07\xd0\x00\x00\x00\x00\xa3"
+FRAME_BAD_HEADER = b"\xfe\x86\x01\x9f\x00\x00\x00\x00\xda"
+FRAME_BAD_CHECKSUM = b"\xff\x86\x01\x9f\x00\x00\x00\x00\x00"
+COMMAND_READ_CO2 = b"\xff\x01\x86\x00\x00\x00\x00\x00\x79"
+FRAME_SATURATED = b"\xff\xff\xff\xff\xff\xff\xff\xff\x07"
+
+CHECKSUM_FRAMES = (FRAME_415_PPM, FRAME_2000_PPM, COMMAND_READ_CO2, FRAME_SATURATED)
+
+RE_WIDTH_7 = re.compile(r"Invalid frame width: 7")
+RE_WIDTH_8 = re.compile(r"Invalid frame width: 8")
+RE_NOT_2D = re.compile(r"expected 2-D uint8, got 1-D uint8")
+RE_NOT_UINT8 = re.compile(r"expected 2-D uint8, got 2-D int64")
+RE_PARTIAL_FRAME = re.compile(r"13 bytes is not a multiple of 9")
+
+
+def test_checksum_batch_matches_scalar(batch_backend: str) -> None:
+    """Test batch checksum calculation against the scalar implementation."""
+    buf = b"".join(CHECKSUM_FRAMES)
+    expected = np.array([_checksum(frame) for frame in CHECKSUM_FRAMES], dtype=np.uint8)
+
+    # Concatenated 9-byte frames in a raw buffer
+    assert np.array_equal(_checksum_batch(buf), expected)
+
+    # (N, 8) array without the checksum column
+    frames = np.frombuffer(buf, dtype=np.uint8).reshape(-1, 9)
+    assert np.array_equal(_checksum_batch(frames[:, :8]), expected)
+
+
+def test_checksum_batch_rejects_narrow_frames(batch_backend: str) -> None:
+    """Test frame arrays too narrow to hold the checksummed bytes are rejected."""
+    with pytest.raises(ValueError, match=RE_WIDTH_7):
+        _checksum_batch(np.zeros((2, 7), dtype=np.uint8))
+
+
+def test_parse_many(batch_backend: str) -> None:
+    """Test batch validation and decoding of read responses."""
+    buf = b"".join(
+        [FRAME_415_PPM, FRAME_2000_PPM, FRAME_BAD_HEADER, FRAME_BAD_CHECKSUM]
+    )
+
+    ppm, valid = _parse_many(buf)
+
+    assert ppm.tolist() == [415, 2000, 0, 0]
+    assert valid.tolist() == [True, True, False, False]
+    assert ppm.dtype == np.uint16
+
+
+@pytest.mark.parametrize(
+    "shape,dtype,message",
+    [
+        ((2, 8), "uint8", RE_WIDTH_8),
+        ((18,), "uint8", RE_NOT_2D),
+        ((2, 9), "int64", RE_NOT_UINT8),
+    ],
+)
+def test_parse_many_rejects_bad_arrays(
+    batch_backend: str, shape: Tuple[int, ...], dtype: str, message: Pattern[str]
+) -> None:
+    """Test malformed frame arrays are rejected before either backend runs."""
+    with pytest.raises(ValueError, match=message):
+        _parse_many(np.zeros(shape, dtype=dtype))
+
+
+def test_parse_many_rejects_partial_buffer() -> None:
+    """Test buffers with a trailing partial frame are rejected."""
+    with pytest.raises(ValueError, match=RE_PARTIAL_FRAME):
+        _parse_many(FRAME_415_PPM + FRAME_2000_PPM[:4])
@@ -1,52 +1,63 @@
 """Test checksum calculation functionality."""
 
-from mhz14a.sensor import _checksum
+import pytest
 
+from mhz14a.sensor import _checksum, _checksum_generic
 
-def test_checksum_read_co2_command() -> None:
-    """Test checksum calculation for read CO₂ command."""
-    # Command: FF 01 86 00 00 00 00 00
-    frame = bytes([0xFF, 0x01, 0x86, 0x00, 0x00, 0x00, 0x00, 0x00])
-    expected_checksum = 0x79  # 121 decimal
-    assert _checksum(frame) == expected_checksum
+# Command frames (first 8 bytes)
+FRAME_READ_CO2 = b"\xff\x01\x86\x00\x00\x00\x00\x00"
+FRAME_ZERO_CALIBRATE = b"\xff\x01\x87\x00\x00\x00\x00\x00"
+FRAME_SPAN_2000 = b"\xff\x01\x88\x07\xd0\x00\x00\x00"
+FRAME_ABC_ON = b"\xff\x01\x79\xa0\x00\x00\x00\x00"
+FRAME_RANGE_5000 = b"\xff\x01\x99\x13\x88\x00\x00\x00"
 
+# Response frames (first 8 bytes)
+RESPONSE_2000_PPM = b"\xff\x86\x07\xd0\x00\x00\x00\x00"
+RESPONSE_415_PPM = b"\xff\x86\x01\x9f\x00\x00\x00\x00"
 
-def test_checksum_various_commands() -> None:
-    """Test checksum calculation for various commands."""
-    test_cases = [
-        # Zero calibration: FF 01 87 00 00 00 00 00
-        (bytes([0xFF, 0x01, 0x87, 0x00, 0x00, 0x00, 0x00, 0x00]), 0x78),
-        # Span calibration 2000ppm: FF 01 88 07 D0 00 00 00
-        (bytes([0xFF, 0x01, 0x88, 0x07, 0xD0, 0x00, 0x00, 0x00]), 0xA0),
-        # ABC enable: FF 01 79 A0 00 00 00 00
-        (bytes([0xFF, 0x01, 0x79, 0xA0, 0x00, 0x00, 0x00, 0x00]), 0xE6),
-        # Range 5000: FF 01 99 13 88 00 00 00
-        (bytes([0xFF, 0x01, 0x99, 0x13, 0x88, 0x00, 0x00, 0x00]), 0xCB),
-    ]
+# Edge case frames
+FRAME_ZEROS = b"\xff\x01\x00\x00\x00\x00\x00\x00"
+FRAME_ALL_FF = b"\xff\xff\xff\xff\xff\xff\xff\xff"
 
-    for frame, expected in test_cases:
-        assert _checksum(frame) == expected
+COMMAND_CASES = (
+    (FRAME_READ_CO2, 0x79),
+    (FRAME_ZERO_CALIBRATE, 0x78),
+    (FRAME_SPAN_2000, 0xA0),
+    (FRAME_ABC_ON, 0xE6),
+    (FRAME_RANGE_5000, 0xCB),
+)
 
+RESPONSE_CASES = (
+    (RESPONSE_2000_PPM, 0xA3),
+    (RESPONSE_415_PPM, 0xDA),
+)
 
-def test_checksum_response_validation() -> None:
-    """Test checksum validation for sensor responses."""
-    # Typical response for 2000 ppm: FF 86 07 D0 00 00 00 00 A3
-    response = bytes([0xFF, 0x86, 0x07, 0xD0, 0x00, 0x00, 0x00, 0x00])
-    expected_checksum = 0xA3
-    assert _checksum(response) == expected_checksum
+EDGE_CASES = (
+    (FRAME_ZEROS, 0xFF),  # 256 - 1 = 255
+    (FRAME_ALL_FF, 0x07),  # 256 - (7 * 255) & 0xFF = 7
+)
+
+
+@pytest.mark.parametrize("frame,expected", COMMAND_CASES)
+def test_checksum_commands(frame: bytes, expected: int) -> None:
+    """Test checksum calculation for command frames."""
+    assert _checksum(frame) == expected
 
-    # Response for 415 ppm: FF 86 01 9F 00 00 00 00 DA
-    response = bytes([0xFF, 0x86, 0x01, 0x9F, 0x00, 0x00, 0x00, 0x00])
-    expected_checksum = 0xDA
-    assert _checksum(response) == expected_checksum
+
+@pytest.mark.parametrize("frame,expected", RESPONSE_CASES)
+def test_checksum_response_validation(frame: bytes, expected: int) -> None:
+    """Test checksum validation for sensor responses."""
+    assert _checksum(frame) == expected
 
 
-def test_checksum_edge_cases() -> None:
+@pytest.mark.parametrize("frame,expected", EDGE_CASES)
+def test_checksum_edge_cases(frame: bytes, expected: int) -> None:
     """Test checksum calculation edge cases."""
-    # All zeros except header and command
-    frame = bytes([0xFF, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00])
-    assert _checksum(frame) == 0xFF  # 256 - 1 = 255
+    assert _checksum(frame) == expected
+
 
-    # All 0xFF values
-    frame = bytes([0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])
-    assert _checksum(frame) == 0x07  # 256 - (7 * 255) & 0xFF = 7
+@pytest.mark.parametrize("frame,expected", COMMAND_CASES + RESPONSE_CASES + EDGE_CASES)
+def test_checksum_generic(frame: bytes, expected: int) -> None:
+    """Test the variable-length checksum against the fixed-size one."""
+    assert _checksum_generic(frame) == expected
+    assert _checksum_generic(frame) == _checksum(frame)
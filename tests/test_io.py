@@ -0,0 +1,61 @@
+"""Test batch decoding of recorded response logs."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from mhz14a.exceptions import MHZ14AError
+from mhz14a.io import decode, load_log
+
+np = pytest.importorskip("numpy")
+
+FRAME_415_PPM = b"\xff\x86\x01\x9f\x00\x00\x00\x00\xda"
+FRAME_2000_PPM = b"\xff\x86\x07\xd0\x00\x00\x00\x00\xa3"
+FRAME_BAD_CHECKSUM = b"\xff\x86\x01\x9f\x00\x00\x00\x00\x00"
+
+RE_LOG_SIZE = re.compile(r"Invalid log size: 13 bytes")
+RE_WIDTH_8 = re.compile(r"Invalid frame width: 8")
+
+
+def test_load_and_decode_log(tmp_path: Path) -> None:
+    """Test loading a log file and decoding its readings."""
+    log = tmp_path / "co2.bin"
+    log.write_bytes(FRAME_415_PPM + FRAME_BAD_CHECKSUM + FRAME_2000_PPM)
+
+    frames = load_log(log)
+    assert frames.shape == (3, 9)
+    assert frames.dtype == np.uint8
+    assert frames.flags.writeable
+
+    ppm, valid = decode(frames)
+    assert ppm.tolist() == [415, 0, 2000]
+    assert valid.tolist() == [True, False, True]
+
+
+def test_load_log_truncated(tmp_path: Path) -> None:
+    """Test rejection of a log with a partial trailing frame."""
+    log = tmp_path / "co2.bin"
+    log.write_bytes(FRAME_415_PPM + FRAME_2000_PPM[:4])
+
+    with pytest.raises(MHZ14AError, match=RE_LOG_SIZE):
+        load_log(log)
+
+
+def test_load_log_frames_editable_in_place(tmp_path: Path) -> None:
+    """Test loaded frames can be patched in place and re-decoded."""
+    log = tmp_path / "co2.bin"
+    log.write_bytes(FRAME_BAD_CHECKSUM)
+
+    frames = load_log(log)
+    frames[0, 8] = 0xDA
+
+    ppm, valid = decode(frames)
+    assert ppm.tolist() == [415]
+    assert valid.tolist() == [True]
+
+
+def test_decode_rejects_wrong_frame_width() -> None:
+    """Test decoding rejects arrays that are not 9 bytes wide."""
+    with pytest.raises(ValueError, match=RE_WIDTH_8):
+        decode(np.zeros((2, 8), dtype=np.uint8))
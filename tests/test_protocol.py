@@ -0,0 +1,171 @@
+"""Test MH-Z14A serial protocol handling with a mocked serial port."""
+
+import re
+from typing import Tuple
+
+import pytest
+import serial
+
+from _fakes import FakeSerial
+from mhz14a.exceptions import MHZ14AError
+from mhz14a.sensor import (
+    _ABC_COMMANDS,
+    _RANGE_COMMANDS,
+    _READ_CO2_COMMAND,
+    _ZERO_CALIBRATE_COMMAND,
+    MHZ14A,
+)
+
+SensorFixture = Tuple[MHZ14A, FakeSerial]
+
+RE_INVALID_HEADER = re.compile(r"Invalid header")
+RE_INVALID_COMMAND = re.compile(r"Invalid command in response")
+RE_CHECKSUM = re.compile(r"Checksum mismatch")
+RE_INCOMPLETE = re.compile(r"Incomplete response: 4/9 bytes")
+RE_PARTIAL = re.compile(r"Partial write")
+RE_TIMEOUT = re.compile(r"Read failed after 3 attempts")
+RE_RANGE = re.compile(r"Invalid range")
+
+
+@pytest.mark.parametrize(
+    "command,expected",
+    [
+        (_READ_CO2_COMMAND, b"\xff\x01\x86\x00\x00\x00\x00\x00\x79"),
+        (_ZERO_CALIBRATE_COMMAND, b"\xff\x01\x87\x00\x00\x00\x00\x00\x78"),
+        (_ABC_COMMANDS[True], b"\xff\x01\x79\xa0\x00\x00\x00\x00\xe6"),
+        (_ABC_COMMANDS[False], b"\xff\x01\x79\x00\x00\x00\x00\x00\x86"),
+        (_RANGE_COMMANDS[2000], b"\xff\x01\x99\x07\xd0\x00\x00\x00\x8f"),
+        (_RANGE_COMMANDS[5000], b"\xff\x01\x99\x13\x88\x00\x00\x00\xcb"),
+        (_RANGE_COMMANDS[10000], b"\xff\x01\x99\x27\x10\x00\x00\x00\x2f"),
+    ],
+)
+def test_precomputed_commands(command: bytes, expected: bytes) -> None:
+    """Test precomputed command frames against known-good bytes."""
+    assert command == expected
+
+
+class TestMHZ14AProtocol:
+    """Test sensor protocol communication."""
+
+    def test_read_co2_success(self, sensor: SensorFixture) -> None:
+        """Test successful CO₂ reading."""
+        sensor_obj, fake_serial = sensor
+        # Response for 415 ppm: FF 86 01 9F 00 00 00 00 DA
+        fake_serial.response = b"\xff\x86\x01\x9f\x00\x00\x00\x00\xda"
+
+        assert sensor_obj.read_co2() == 415
+
+        assert fake_serial.last_write == _READ_CO2_COMMAND
+        assert fake_serial.write_count == 1
+        assert fake_serial.read_count == 1
+
+    def test_read_co2_high_concentration(self, sensor: SensorFixture) -> None:
+        """Test CO₂ reading using both data bytes."""
+        sensor_obj, fake_serial = sensor
+        # Response for 2000 ppm: FF 86 07 D0 00 00 00 00 A3
+        fake_serial.response = b"\xff\x86\x07\xd0\x00\x00\x00\x00\xa3"
+
+        assert sensor_obj.read_co2() == 2000
+
+    def test_invalid_header_error(self, sensor: SensorFixture) -> None:
+        """Test response with invalid header byte."""
+        sensor_obj, fake_serial = sensor
+        fake_serial.response = b"\xfe\x86\x01\x9f\x00\x00\x00\x00\xda"
+
+        with pytest.raises(MHZ14AError, match=RE_INVALID_HEADER):
+            sensor_obj.read_co2()
+
+    def test_invalid_command_error(self, sensor: SensorFixture) -> None:
+        """Test response echoing the wrong command byte."""
+        sensor_obj, fake_serial = sensor
+        fake_serial.response = b"\xff\x87\x01\x9f\x00\x00\x00\x00\xd9"
+
+        with pytest.raises(MHZ14AError, match=RE_INVALID_COMMAND):
+            sensor_obj.read_co2()
+
+    def test_checksum_mismatch_error(self, sensor: SensorFixture) -> None:
+        """Test response with wrong checksum byte."""
+        sensor_obj, fake_serial = sensor
+        fake_serial.response = b"\xff\x86\x01\x9f\x00\x00\x00\x00\x00"
+
+        with pytest.raises(MHZ14AError, match=RE_CHECKSUM):
+            sensor_obj.read_co2()
+
+    def test_incomplete_response_error(self, sensor: SensorFixture) -> None:
+        """Test response shorter than a full frame."""
+        sensor_obj, fake_serial = sensor
+        fake_serial.response = b"\xff\x86\x01\x9f"
+
+        with pytest.raises(MHZ14AError, match=RE_INCOMPLETE):
+            sensor_obj.read_co2()
+        assert fake_serial.read_count == 1
+
+    def test_partial_write_error(self, sensor: SensorFixture) -> None:
+        """Test command write that does not send all bytes."""
+        sensor_obj, fake_serial = sensor
+        fake_serial.write_result = 5
+
+        with pytest.raises(MHZ14AError, match=RE_PARTIAL):
+            sensor_obj.read_co2()
+
+    def test_timeout_error(
+        self, sensor: SensorFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test read retries exhausted by serial timeouts."""
+        sensor_obj, fake_serial = sensor
+        fake_serial.read_error = serial.SerialTimeoutException("Timeout")
+        monkeypatch.setattr("mhz14a.sensor.time.sleep", lambda _: None)
+
+        with pytest.raises(MHZ14AError, match=RE_TIMEOUT):
+            sensor_obj.read_co2()
+        assert fake_serial.read_count == 3
+
+    def test_zero_calibrate(self, sensor: SensorFixture) -> None:
+        """Test zero point calibration command."""
+        sensor_obj, fake_serial = sensor
+        fake_serial.response = b"\xff\x87\x00\x00\x00\x00\x00\x00\x79"
+
+        sensor_obj.zero_calibrate()
+
+        assert fake_serial.last_write == _ZERO_CALIBRATE_COMMAND
+        assert fake_serial.write_count == 1
+
+    def test_span_calibrate(self, sensor: SensorFixture) -> None:
+        """Test span calibration command."""
+        sensor_obj, fake_serial = sensor
+        fake_serial.response = b"\xff\x88\x00\x00\x00\x00\x00\x00\x78"
+
+        sensor_obj.span_calibrate(2000)
+
+        expected_command = b"\xff\x01\x88\x07\xd0\x00\x00\x00\xa0"
+        assert fake_serial.last_write == expected_command
+        assert fake_serial.write_count == 1
+
+    @pytest.mark.parametrize("enable", [True, False])
+    def test_set_abc(self, sensor: SensorFixture, enable: bool) -> None:
+        """Test enabling and disabling automatic baseline correction."""
+        sensor_obj, fake_serial = sensor
+        fake_serial.response = b"\xff\x79\x00\x00\x00\x00\x00\x00\x87"
+
+        sensor_obj.set_abc(enable)
+
+        assert fake_serial.last_write == _ABC_COMMANDS[enable]
+        assert fake_serial.write_count == 1
+
+    def test_set_range(self, sensor: SensorFixture) -> None:
+        """Test measurement range command."""
+        sensor_obj, fake_serial = sensor
+        fake_serial.response = b"\xff\x99\x00\x00\x00\x00\x00\x00\x67"
+
+        sensor_obj.set_range(5000)
+
+        assert fake_serial.last_write == _RANGE_COMMANDS[5000]
+        assert fake_serial.write_count == 1
+
+    def test_invalid_range_error(self, sensor: SensorFixture) -> None:
+        """Test rejection of unsupported measurement range."""
+        sensor_obj, fake_serial = sensor
+
+        with pytest.raises(ValueError, match=RE_RANGE):
+            sensor_obj.set_range(3000)
+        assert fake_serial.write_count == 0